@@ -2,6 +2,7 @@ import os
 import logging
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
 from sqlalchemy.orm import DeclarativeBase
 from celery import Celery
 from dotenv import load_dotenv
@@ -10,7 +11,7 @@ from dotenv import load_dotenv
 load_dotenv()
 
 # Configure logging
-logging.basicConfig(level=logging.DEBUG)
+logging.basicConfig(level=os.getenv('LOG_LEVEL', 'INFO').upper())
 
 class Base(DeclarativeBase):
     pass
@@ -36,12 +37,14 @@ def make_celery(app_name=__name__):
     )
     
     celery.conf.update(
-        task_serializer='json',
-        accept_content=['json'],
-        result_serializer='json',
+        task_serializer='msgpack',
+        accept_content=['msgpack', 'json'],
+        result_serializer='msgpack',
         timezone='UTC',
         enable_utc=True,
         result_expires=3600,
+        # Report tasks are long; don't let one worker reserve a queue of them
+        worker_prefetch_multiplier=1,
         broker_connection_retry_on_startup=True,
         broker_connection_retry=True,
     )
@@ -64,6 +67,18 @@ def create_app():
     # Initialize extensions
     db.init_app(app)
     
+    # Tune SQLite for concurrent access from the web app and Celery worker
+    with app.app_context():
+        @event.listens_for(db.engine, "connect")
+        def _set_sqlite_pragma(dbapi_conn, _):
+            cursor = dbapi_conn.cursor()
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute("PRAGMA busy_timeout=5000")
+            cursor.execute("PRAGMA temp_store=MEMORY")
+            cursor.execute("PRAGMA cache_size=-20000")
+            cursor.close()
+    
     # Register blueprints
     from app.api.reports import reports_bp
     app.register_blueprint(reports_bp)
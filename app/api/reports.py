@@ -1,13 +1,18 @@
 import uuid
 import os
+import gzip
 import logging
 from flask import Blueprint, jsonify, request, send_file, render_template
+from sqlalchemy import select
 from app import db
 from app.models.db_models import Report
 from app import celery
 
 reports_bp = Blueprint('reports', __name__)
 
+# Upper bound for ?limit= on the report listing
+MAX_REPORTS_PAGE_SIZE = 200
+
 @reports_bp.route('/')
 def index():
     """Main page with API testing interface"""
@@ -98,13 +103,37 @@ def get_report(report_id):
                     "message": "Report completed but file is missing"
                 }), 500
             
-            # Send CSV file
-            return send_file(
+            download_name = f'store_report_{report_id}.csv'
+            
+            # Reports stored gzip-compressed are sent as-is to clients that
+            # accept gzip, and decompressed on the fly for those that don't
+            # (quality-aware, so 'gzip;q=0' counts as not accepted)
+            if report.report_path.endswith('.gz') and request.accept_encodings['gzip'] <= 0:
+                response = send_file(
+                    gzip.open(report.report_path, 'rb'),
+                    as_attachment=True,
+                    download_name=download_name,
+                    mimetype='text/csv',
+                    conditional=True,
+                    last_modified=os.path.getmtime(report.report_path)
+                )
+                response.vary.add('Accept-Encoding')
+                return response
+            
+            # Send CSV file, answering repeat polls with 304 Not Modified
+            response = send_file(
                 report.report_path,
                 as_attachment=True,
-                download_name=f'store_report_{report_id}.csv',
-                mimetype='text/csv'
+                download_name=download_name,
+                mimetype='text/csv',
+                conditional=True,
+                etag=True,
+                last_modified=os.path.getmtime(report.report_path)
             )
+            if report.report_path.endswith('.gz'):
+                response.headers['Content-Encoding'] = 'gzip'
+                response.vary.add('Accept-Encoding')
+            return response
         
         elif report.status == 'Failed':
             return jsonify({
@@ -129,23 +158,29 @@ def get_report(report_id):
 @reports_bp.route('/reports', methods=['GET'])
 def list_reports():
     """
-    List all reports for debugging purposes.
+    List reports for debugging purposes, newest first.
+    Supports ?limit= (max 200) and ?cursor= (id of the last report seen).
     """
     try:
-        reports = Report.query.order_by(Report.id.desc()).limit(50).all()
+        limit = min(max(request.args.get('limit', 50, type=int), 1), MAX_REPORTS_PAGE_SIZE)
+        cursor = request.args.get('cursor', type=int)
+        
+        # Select plain columns so rows are not hydrated into ORM objects
+        query = select(Report.report_id, Report.status, Report.report_path, Report.id)
+        if cursor is not None:
+            query = query.where(Report.id < cursor)
+        rows = db.session.execute(query.order_by(Report.id.desc()).limit(limit)).all()
         
-        report_list = []
-        for report in reports:
-            report_list.append({
-                "report_id": report.report_id,
-                "status": report.status,
-                "report_path": report.report_path,
-                "created_at": report.id  # Using ID as a proxy for creation order
-            })
+        # 'created_at' uses the ID as a proxy for creation order
+        report_list = [
+            dict(zip(('report_id', 'status', 'report_path', 'created_at'), row))
+            for row in rows
+        ]
         
         return jsonify({
             "reports": report_list,
-            "count": len(report_list)
+            "count": len(report_list),
+            "next_cursor": rows[-1].id if len(rows) == limit else None
         }), 200
         
     except Exception as e:
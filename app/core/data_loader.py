@@ -1,11 +1,18 @@
 import os
-import csv
 import logging
-from datetime import datetime, time
-from typing import Optional
+from datetime import datetime
 import pandas as pd
+from sqlalchemy import Integer, inspect
 from app import db
-from app.models.db_models import StoreStatus, BusinessHours, Timezone
+from app.models.db_models import StoreStatus, BusinessHours, Timezone, STATUS_CODES, STATUS_ACTIVE, STATUS_INACTIVE
+
+# Rows per bulk insert when loading the (large) store status CSV
+CSV_CHUNK_SIZE = 100_000
+
+# SQLite storage formats of SQLAlchemy's DateTime and Time columns, used when
+# inserting pre-formatted rows straight through the DBAPI cursor
+SQLITE_DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S.%f'
+SQLITE_TIME_FORMAT = '%H:%M:%S.%f'
 
 def load_data():
     """
@@ -19,6 +26,36 @@ def load_data():
     load_business_hours(os.path.join(data_dir, 'menu_hours.csv'))
     load_timezones(os.path.join(data_dir, 'timezone.csv'))
 
+def migrate_store_status_codes():
+    """
+    Rebuild a store_status table created before status became a SmallInteger
+    code, converting its 'active'/'inactive' strings to the codes.
+    db.create_all() does not alter existing tables, so run this after it.
+    """
+    columns = {column['name']: column['type'] for column in inspect(db.engine).get_columns('store_status')}
+    if isinstance(columns['status'], Integer):
+        return
+    
+    logging.info("Rebuilding store_status with integer status codes")
+    
+    # SQLite cannot change a column's type in place: move the old table
+    # aside, recreate it from the model and copy the rows across
+    with db.engine.begin() as conn:
+        conn.exec_driver_sql("ALTER TABLE store_status RENAME TO store_status_legacy")
+        for index in inspect(conn).get_indexes('store_status_legacy'):
+            conn.exec_driver_sql(f"DROP INDEX {index['name']}")
+        StoreStatus.__table__.create(conn)
+        conn.execute(
+            db.text(
+                "INSERT INTO store_status (id, store_id, timestamp_utc, status) "
+                "SELECT id, store_id, timestamp_utc, CASE status "
+                "WHEN 'active' THEN :active WHEN 'inactive' THEN :inactive END "
+                "FROM store_status_legacy WHERE status IN ('active', 'inactive')"
+            ),
+            {'active': STATUS_ACTIVE, 'inactive': STATUS_INACTIVE}
+        )
+        conn.exec_driver_sql("DROP TABLE store_status_legacy")
+
 def load_store_status(csv_path: str):
     """
     Load store status data from CSV.
@@ -33,33 +70,36 @@ def load_store_status(csv_path: str):
     db.session.query(StoreStatus).delete()
     
     try:
-        df = pd.read_csv(csv_path)
-        
         records_added = 0
-        for _, row in df.iterrows():
-            try:
-                # Parse timestamp
-                timestamp_str = str(row['timestamp_utc'])
-                # Handle different timestamp formats
-                timestamp_utc = parse_timestamp(timestamp_str)
-                
-                status_record = StoreStatus(
-                    store_id=str(row['store_id']),
-                    timestamp_utc=timestamp_utc,
-                    status=str(row['status'])
+        
+        # Read only the needed columns with explicit dtypes, in chunks so
+        # large files never have to be held in memory all at once
+        chunks = pd.read_csv(
+            csv_path,
+            usecols=['store_id', 'timestamp_utc', 'status'],
+            dtype={'store_id': 'string', 'status': 'category', 'timestamp_utc': 'string'},
+            chunksize=CSV_CHUNK_SIZE
+        )
+        
+        for df in chunks:
+            # Parse timestamps in bulk rather than row by row
+            df['timestamp_utc'] = parse_timestamps(df['timestamp_utc'])
+            
+            df['status'] = df['status'].map(STATUS_CODES)
+            
+            invalid = df['timestamp_utc'].isna() | df['status'].isna()
+            if invalid.any():
+                logging.error(
+                    f"Skipping {int(invalid.sum())} store status rows with unparseable timestamps or unknown statuses"
                 )
-                
-                db.session.add(status_record)
-                records_added += 1
-                
-                # Commit in batches for better performance
-                if records_added % 1000 == 0:
-                    db.session.commit()
-                    logging.info(f"Loaded {records_added} store status records")
-                    
-            except Exception as e:
-                logging.error(f"Error processing store status row: {row}, error: {e}")
-                continue
+                df = df[~invalid]
+            
+            rows = df[['store_id', 'timestamp_utc', 'status']].astype({'status': int})
+            rows['timestamp_utc'] = rows['timestamp_utc'].dt.strftime(SQLITE_DATETIME_FORMAT)
+            bulk_insert_rows(StoreStatus, rows)
+            records_added += len(rows)
+            
+            logging.info(f"Loaded {records_added} store status records")
         
         db.session.commit()
         logging.info(f"Successfully loaded {records_added} store status records")
@@ -83,31 +123,32 @@ def load_business_hours(csv_path: str):
     db.session.query(BusinessHours).delete()
     
     try:
-        df = pd.read_csv(csv_path)
+        df = pd.read_csv(
+            csv_path,
+            usecols=['store_id', 'dayOfWeek', 'start_time_local', 'end_time_local'],
+            dtype={'store_id': str, 'start_time_local': str, 'end_time_local': str}
+        )
         
-        records_added = 0
-        for _, row in df.iterrows():
-            try:
-                # Parse times
-                start_time = parse_time(str(row['start_time_local']))
-                end_time = parse_time(str(row['end_time_local']))
-                
-                business_hours = BusinessHours(
-                    store_id=str(row['store_id']),
-                    dayOfWeek=int(row['dayOfWeek']),
-                    start_time_local=start_time,
-                    end_time_local=end_time
-                )
-                
-                db.session.add(business_hours)
-                records_added += 1
-                
-            except Exception as e:
-                logging.error(f"Error processing business hours row: {row}, error: {e}")
-                continue
+        # Parse times in bulk rather than row by row
+        df['dayOfWeek'] = pd.to_numeric(df['dayOfWeek'], errors='coerce')
+        df['start_time_local'] = pd.to_datetime(
+            df['start_time_local'], format='mixed', errors='coerce'
+        ).dt.strftime(SQLITE_TIME_FORMAT)
+        df['end_time_local'] = pd.to_datetime(
+            df['end_time_local'], format='mixed', errors='coerce'
+        ).dt.strftime(SQLITE_TIME_FORMAT)
+        
+        invalid = df[['dayOfWeek', 'start_time_local', 'end_time_local']].isna().any(axis=1)
+        if invalid.any():
+            logging.error(f"Skipping {int(invalid.sum())} business hours rows with unparseable values")
+            df = df[~invalid].copy()
+        df['dayOfWeek'] = df['dayOfWeek'].astype(int)
+        
+        rows = df[['store_id', 'dayOfWeek', 'start_time_local', 'end_time_local']]
+        bulk_insert_rows(BusinessHours, rows)
         
         db.session.commit()
-        logging.info(f"Successfully loaded {records_added} business hours records")
+        logging.info(f"Successfully loaded {len(rows)} business hours records")
         
     except Exception as e:
         logging.error(f"Error loading business hours data: {e}")
@@ -128,77 +169,57 @@ def load_timezones(csv_path: str):
     db.session.query(Timezone).delete()
     
     try:
-        df = pd.read_csv(csv_path)
+        df = pd.read_csv(
+            csv_path,
+            usecols=['store_id', 'timezone_str'],
+            dtype={'store_id': str, 'timezone_str': str}
+        )
         
-        records_added = 0
-        for _, row in df.iterrows():
-            try:
-                timezone_record = Timezone(
-                    store_id=str(row['store_id']),
-                    timezone_str=str(row['timezone_str'])
-                )
-                
-                db.session.add(timezone_record)
-                records_added += 1
-                
-            except Exception as e:
-                logging.error(f"Error processing timezone row: {row}, error: {e}")
-                continue
+        rows = df[['store_id', 'timezone_str']]
+        bulk_insert_rows(Timezone, rows)
         
         db.session.commit()
-        logging.info(f"Successfully loaded {records_added} timezone records")
+        logging.info(f"Successfully loaded {len(rows)} timezone records")
         
     except Exception as e:
         logging.error(f"Error loading timezone data: {e}")
         db.session.rollback()
         raise
 
-def parse_timestamp(timestamp_str: str) -> datetime:
+def bulk_insert_rows(model, rows: pd.DataFrame):
     """
-    Parse timestamp string into datetime object.
-    Handles multiple common formats.
+    Insert DataFrame rows with a single DBAPI executemany on the session's
+    connection, skipping ORM mapping and per-row SQLAlchemy type processing.
+    Values must already be in SQLite storage form (dates and times as text).
     """
-    # Common timestamp formats
-    formats = [
-        '%Y-%m-%d %H:%M:%S.%f %Z',  # 2023-01-25 12:05:19.846849 UTC
-        '%Y-%m-%d %H:%M:%S %Z',     # 2023-01-25 12:05:19 UTC
-        '%Y-%m-%d %H:%M:%S.%f',     # 2023-01-25 12:05:19.846849
-        '%Y-%m-%d %H:%M:%S',        # 2023-01-25 12:05:19
-        '%Y-%m-%dT%H:%M:%S.%fZ',    # 2023-01-25T12:05:19.846849Z
-        '%Y-%m-%dT%H:%M:%SZ',       # 2023-01-25T12:05:19Z
-        '%Y-%m-%dT%H:%M:%S.%f',     # 2023-01-25T12:05:19.846849
-        '%Y-%m-%dT%H:%M:%S',        # 2023-01-25T12:05:19
-    ]
-    
-    for fmt in formats:
-        try:
-            return datetime.strptime(timestamp_str, fmt)
-        except ValueError:
-            continue
+    columns = ', '.join(rows.columns)
+    placeholders = ', '.join('?' * len(rows.columns))
+    sql = f"INSERT INTO {model.__tablename__} ({columns}) VALUES ({placeholders})"
     
-    # If none of the formats work, try pandas parsing
+    cursor = db.session.connection().connection.cursor()
     try:
-        return pd.to_datetime(timestamp_str).to_pydatetime()
-    except Exception:
-        raise ValueError(f"Unable to parse timestamp: {timestamp_str}")
+        cursor.executemany(sql, rows.itertuples(index=False, name=None))
+    finally:
+        cursor.close()
 
-def parse_time(time_str: str) -> time:
+def parse_timestamps(timestamps: pd.Series) -> pd.Series:
     """
-    Parse time string into time object.
+    Parse a column of timestamp strings into naive UTC datetimes.
+    Handles mixed formats (with or without fractional seconds, 'T'
+    separator or 'UTC'/'Z' suffix); unparseable values become NaT.
     """
-    # Common time formats
-    formats = [
-        '%H:%M:%S',  # 09:00:00
-        '%H:%M',     # 09:00
-        '%I:%M:%S %p',  # 09:00:00 AM
-        '%I:%M %p',     # 09:00 AM
-    ]
+    return pd.to_datetime(
+        timestamps, format='mixed', utc=True, errors='coerce'
+    ).dt.tz_convert(None)
+
+def parse_timestamp(timestamp_str: str) -> datetime:
+    """
+    Parse timestamp string into datetime object.
+    Handles multiple common formats.
+    """
+    parsed = parse_timestamps(pd.Series([timestamp_str])).iloc[0]
     
-    for fmt in formats:
-        try:
-            time_obj = datetime.strptime(time_str, fmt).time()
-            return time_obj
-        except ValueError:
-            continue
+    if pd.isna(parsed):
+        raise ValueError(f"Unable to parse timestamp: {timestamp_str}")
     
-    raise ValueError(f"Unable to parse time: {time_str}")
+    return parsed.to_pydatetime()
@@ -1,21 +1,67 @@
 import os
 import csv
+import gzip
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, List, Tuple, Optional, Any
+from collections import defaultdict
+from datetime import datetime, time, timedelta, tzinfo
+from itertools import repeat
+from operator import itemgetter
+from typing import Dict, List, Tuple, Optional
+import numpy as np
 import pandas as pd
-import pytz
+from sqlalchemy import select
 from celery import Task
+from celery.signals import worker_process_init
 from app import celery, db
-from app.models.db_models import StoreStatus, BusinessHours, Timezone, Report
-from app.utils.time_helpers import convert_utc_to_local, get_business_hours_for_day
+from app.models.db_models import StoreStatus, BusinessHours, Timezone, Report, STATUS_ACTIVE
+from app.utils.time_helpers import UTC, get_tz, get_timezone_offset_seconds_for_window
+
+try:
+    from numba import njit
+except ImportError:  # optional: falls back to the NumPy implementation
+    njit = None
+
+# Rows per pd.read_sql chunk when streaming the report window's observations
+STATUS_READ_CHUNK_SIZE = 100_000
+
+# Per-store observations: sorted epoch-nanosecond timestamps, is-active flags
+# and cumulative active nanoseconds from the first observation to each one
+Observations = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+# A store's business hours: day of week (0=Monday) -> [(start, end)] local times
+BusinessHoursByDay = Dict[int, List[Tuple[time, time]]]
+
+# Observation arrays for a store with no status data in the report window
+EMPTY_OBSERVATIONS = (
+    np.empty(0, dtype='int64'), np.empty(0, dtype=bool), np.empty(0, dtype='int64')
+)
+
+def to_epoch_ns(dt: datetime) -> int:
+    """
+    Convert a naive UTC datetime to integer nanoseconds since the epoch.
+    """
+    return int(np.datetime64(dt, 'ns').astype('int64'))
+
+# Flask app shared by every task run in this worker process
+_flask_app = None
+
+def get_flask_app():
+    """Create the Flask app on first use and reuse it afterwards"""
+    global _flask_app
+    if _flask_app is None:
+        from app import create_app
+        _flask_app = create_app()
+    return _flask_app
+
+@worker_process_init.connect
+def init_worker_app(**kwargs):
+    """Build the Flask app once when a worker process starts"""
+    get_flask_app()
 
 class CallbackTask(Task):
     """Custom task class to ensure Flask app context"""
     def __call__(self, *args, **kwargs):
-        from app import create_app
-        app = create_app()
-        with app.app_context():
+        with get_flask_app().app_context():
             return self.run(*args, **kwargs)
 
 @celery.task(base=CallbackTask, bind=True)
@@ -38,11 +84,11 @@ def generate_report_task(self, report_id: str):
         # Generate report data
         report_data = generate_store_metrics(current_time)
         
-        # Save to CSV file
+        # Save to gzip-compressed CSV file
         reports_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'reports')
         os.makedirs(reports_dir, exist_ok=True)
         
-        csv_path = os.path.join(reports_dir, f'report_{report_id}.csv')
+        csv_path = os.path.join(reports_dir, f'report_{report_id}.csv.gz')
         save_report_to_csv(report_data, csv_path)
         
         # Update report in database
@@ -58,10 +104,9 @@ def generate_report_task(self, report_id: str):
         
         # Update report status to failed
         try:
-            report = Report.query.filter_by(report_id=report_id).first()
-            if report:
-                report.status = 'Failed'
-                db.session.commit()
+            db.session.rollback()
+            Report.query.filter_by(report_id=report_id).update({'status': 'Failed'})
+            db.session.commit()
         except Exception as db_error:
             logging.error(f"Failed to update report status: {db_error}")
         
@@ -86,11 +131,11 @@ def generate_report_sync(report_id: str) -> str:
         # Generate report data
         report_data = generate_store_metrics(current_time)
         
-        # Save to CSV file
+        # Save to gzip-compressed CSV file
         reports_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'reports')
         os.makedirs(reports_dir, exist_ok=True)
         
-        csv_path = os.path.join(reports_dir, f'report_{report_id}.csv')
+        csv_path = os.path.join(reports_dir, f'report_{report_id}.csv.gz')
         save_report_to_csv(report_data, csv_path)
         
         # Update report in database
@@ -106,10 +151,9 @@ def generate_report_sync(report_id: str) -> str:
         
         # Update report status to failed
         try:
-            report = Report.query.filter_by(report_id=report_id).first()
-            if report:
-                report.status = 'Failed'
-                db.session.commit()
+            db.session.rollback()
+            Report.query.filter_by(report_id=report_id).update({'status': 'Failed'})
+            db.session.commit()
         except Exception as db_error:
             logging.error(f"Failed to update report status: {db_error}")
         
@@ -133,68 +177,139 @@ def generate_store_metrics(current_time: datetime) -> List[Dict]:
     """
     Generate uptime/downtime metrics for all stores.
     """
-    # Get all unique store IDs
-    store_ids = db.session.query(StoreStatus.store_id).distinct().all()
-    store_ids = [sid[0] for sid in store_ids]
+    week_ago = current_time - timedelta(weeks=1)
+    
+    # Prefetch everything the per-store calculation needs over one read-only
+    # Core connection, skipping ORM object construction and session bookkeeping
+    with db.engine.connect().execution_options(stream_results=True) as conn:
+        # Get all unique store IDs
+        store_ids = conn.execute(select(StoreStatus.store_id).distinct()).scalars().all()
+        
+        status_query = select(
+            StoreStatus.store_id, StoreStatus.timestamp_utc, StoreStatus.status
+        ).where(
+            StoreStatus.timestamp_utc >= week_ago,
+            StoreStatus.timestamp_utc <= current_time
+        ).order_by(StoreStatus.store_id, StoreStatus.timestamp_utc)
+        status_df = pd.concat(
+            chunk.astype({'status': 'uint8'})
+            for chunk in pd.read_sql(
+                status_query, conn, parse_dates=['timestamp_utc'], chunksize=STATUS_READ_CHUNK_SIZE
+            )
+        ).reset_index(drop=True)
+        
+        business_hours_rows = conn.execute(select(
+            BusinessHours.store_id, BusinessHours.dayOfWeek,
+            BusinessHours.start_time_local, BusinessHours.end_time_local
+        )).all()
+        
+        timezone_map = dict(conn.execute(select(Timezone.store_id, Timezone.timezone_str)).all())
     
     logging.info(f"Processing {len(store_ids)} stores")
     
-    report_data = []
+    # One columnar pass over all observations: each gap counts as uptime when
+    # the observation that opens it is active, accumulated per store so any
+    # interval's inner uptime is a difference of two cumulative values
+    status_df['active'] = status_df['status'].eq(STATUS_ACTIVE)
+    by_store = status_df.groupby('store_id', sort=False)
+    gap_ns = by_store['timestamp_utc'].diff().fillna(pd.Timedelta(0))
+    status_df['active_gap_ns'] = (
+        gap_ns.to_numpy(dtype='timedelta64[ns]').view('int64')
+        * by_store['active'].shift(fill_value=False).to_numpy(dtype=bool)
+    )
+    cumulative_uptime = status_df.groupby('store_id', sort=False)['active_gap_ns'].cumsum().to_numpy()
     
-    for store_id in store_ids:
-        try:
-            metrics = calculate_store_metrics(store_id, current_time)
-            report_data.append(metrics)
-            
-            if len(report_data) % 100 == 0:
-                logging.info(f"Processed {len(report_data)} stores")
-                
-        except Exception as e:
-            logging.error(f"Error processing store {store_id}: {e}")
-            # Add default metrics for failed stores
-            report_data.append({
-                'store_id': store_id,
-                'uptime_last_hour': 0,
-                'uptime_last_day': 0,
-                'uptime_last_week': 0,
-                'downtime_last_hour': 0,
-                'downtime_last_day': 0,
-                'downtime_last_week': 0
-            })
+    all_timestamps = status_df['timestamp_utc'].to_numpy(dtype='datetime64[ns]').view('int64')
+    all_active = status_df['active'].to_numpy()
+    observations_by_store = {
+        store_id: (all_timestamps[positions], all_active[positions], cumulative_uptime[positions])
+        for store_id, positions in by_store.indices.items()
+    }
+    
+    # Business hours indexed by store and day of week for O(1) day lookups
+    business_hours_index = defaultdict(lambda: defaultdict(list))
+    for store_id, day_of_week, start_time_local, end_time_local in business_hours_rows:
+        business_hours_index[store_id][day_of_week].append((start_time_local, end_time_local))
+    
+    # Each store only sees its own observations, business hours and timezone
+    store_args = (
+        store_ids,
+        repeat(current_time),
+        [observations_by_store.get(store_id, EMPTY_OBSERVATIONS) for store_id in store_ids],
+        [dict(business_hours_index.get(store_id, {})) for store_id in store_ids],
+        [get_store_timezone(store_id, timezone_map) for store_id in store_ids]
+    )
+    
+    report_data = list(map(calculate_store_metrics_or_default, *store_args))
+    
+    logging.info(f"Processed {len(report_data)} stores")
     
     return report_data
 
-def calculate_store_metrics(store_id: int, current_time: datetime) -> Dict:
+def calculate_store_metrics_or_default(
+    store_id: int,
+    current_time: datetime,
+    status_observations: Observations,
+    business_hours: BusinessHoursByDay,
+    timezone_str: str
+) -> Dict:
+    """
+    Calculate metrics for a store, falling back to zeros if it fails.
+    """
+    try:
+        return calculate_store_metrics(
+            store_id, current_time, status_observations, business_hours, timezone_str
+        )
+    except Exception as e:
+        logging.error(f"Error processing store {store_id}: {e}")
+        # Add default metrics for failed stores
+        return {
+            'store_id': store_id,
+            'uptime_last_hour': 0,
+            'uptime_last_day': 0,
+            'uptime_last_week': 0,
+            'downtime_last_hour': 0,
+            'downtime_last_day': 0,
+            'downtime_last_week': 0
+        }
+
+def calculate_store_metrics(
+    store_id: int,
+    current_time: datetime,
+    status_observations: Observations,
+    business_hours: BusinessHoursByDay,
+    timezone_str: str
+) -> Dict:
     """
     Calculate uptime/downtime metrics for a specific store.
+    
+    Observations, business hours and timezone are prefetched by the caller,
+    so no queries are issued here.
     """
-    # Get store timezone
-    timezone_str = get_store_timezone(store_id)
-    local_tz = pytz.timezone(timezone_str)
+    local_tz = get_tz(timezone_str)
     
     # Define time periods
     hour_ago = current_time - timedelta(hours=1)
     day_ago = current_time - timedelta(days=1)
     week_ago = current_time - timedelta(weeks=1)
     
-    # Get status observations for the week
-    status_observations = db.session.query(StoreStatus).filter(
-        StoreStatus.store_id == store_id,
-        StoreStatus.timestamp_utc >= week_ago,
-        StoreStatus.timestamp_utc <= current_time
-    ).order_by(StoreStatus.timestamp_utc).all()
+    # The hour and day windows lie inside the week, so one offset covers all three
+    utc_offset_s = get_timezone_offset_seconds_for_window(timezone_str, week_ago, current_time)
     
     # Calculate metrics for each period
     uptime_last_hour, downtime_last_hour = calculate_period_metrics(
-        store_id, status_observations, hour_ago, current_time, local_tz, 'minutes'
+        business_hours, status_observations, hour_ago, current_time, local_tz, 'minutes',
+        utc_offset_s
     )
     
     uptime_last_day, downtime_last_day = calculate_period_metrics(
-        store_id, status_observations, day_ago, current_time, local_tz, 'hours'
+        business_hours, status_observations, day_ago, current_time, local_tz, 'hours',
+        utc_offset_s
     )
     
     uptime_last_week, downtime_last_week = calculate_period_metrics(
-        store_id, status_observations, week_ago, current_time, local_tz, 'hours'
+        business_hours, status_observations, week_ago, current_time, local_tz, 'hours',
+        utc_offset_s
     )
     
     return {
@@ -208,51 +323,40 @@ def calculate_store_metrics(store_id: int, current_time: datetime) -> Dict:
     }
 
 def calculate_period_metrics(
-    store_id: int, 
-    observations: List[StoreStatus], 
+    business_hours: BusinessHoursByDay, 
+    observations: Observations, 
     start_time: datetime, 
     end_time: datetime,
-    local_tz: Any,
-    unit: str
+    local_tz: tzinfo,
+    unit: str,
+    utc_offset_s: Optional[int] = None
 ) -> Tuple[float, float]:
     """
     Calculate uptime and downtime for a specific period.
     """
-    total_uptime = 0.0
-    total_downtime = 0.0
+    timestamps = observations[0]
     
-    # Filter observations within the period
-    period_observations = [
-        obs for obs in observations 
-        if start_time <= obs.timestamp_utc <= end_time
-    ]
-    
-    # If no observations, assume store was closed
-    if not period_observations:
+    # If no observations in the period, assume store was closed
+    lo = np.searchsorted(timestamps, to_epoch_ns(start_time), side='left')
+    hi = np.searchsorted(timestamps, to_epoch_ns(end_time), side='right')
+    if hi <= lo:
         return 0.0, 0.0
     
     # Get business hours for the period
-    business_intervals = get_business_intervals(store_id, start_time, end_time, local_tz)
+    business_intervals = get_business_intervals(
+        business_hours, start_time, end_time, local_tz, utc_offset_s
+    )
+    if not business_intervals:
+        return 0.0, 0.0
     
-    # Calculate uptime/downtime for each business interval
-    for interval_start, interval_end in business_intervals:
-        # Convert to UTC for comparison
-        interval_start_utc = interval_start.astimezone(pytz.UTC).replace(tzinfo=None)
-        interval_end_utc = interval_end.astimezone(pytz.UTC).replace(tzinfo=None)
-        
-        # Get observations within this business interval
-        interval_obs = [
-            obs for obs in period_observations
-            if interval_start_utc <= obs.timestamp_utc <= interval_end_utc
-        ]
-        
-        # Calculate uptime/downtime using interpolation
-        uptime, downtime = interpolate_status_in_interval(
-            interval_obs, interval_start_utc, interval_end_utc
-        )
-        
-        total_uptime += uptime
-        total_downtime += downtime
+    # Convert to epoch nanoseconds for comparison
+    interval_starts = np.array([to_epoch_ns(interval_start) for interval_start, _ in business_intervals])
+    interval_ends = np.array([to_epoch_ns(interval_end) for _, interval_end in business_intervals])
+    
+    # Calculate uptime/downtime across all business intervals using interpolation
+    total_uptime, total_downtime = interpolate_status_in_intervals(
+        observations, interval_starts, interval_ends
+    )
     
     # Convert to requested units
     if unit == 'minutes':
@@ -264,77 +368,129 @@ def calculate_period_metrics(
     
     return total_uptime, total_downtime
 
-def interpolate_status_in_interval(
-    observations: List[StoreStatus], 
-    start_time: datetime, 
-    end_time: datetime
+def interpolate_status_in_intervals(
+    observations: Observations, 
+    interval_starts: np.ndarray, 
+    interval_ends: np.ndarray
 ) -> Tuple[float, float]:
     """
-    Interpolate status within a business interval using the specified logic.
+    Interpolate status within business intervals using the specified logic.
+    
+    Each observation's status is carried forward until the next observation,
+    and the first/last observations in an interval also cover the gaps to its
+    edges; intervals without observations count towards neither total. All
+    intervals are handled in one pass. Bounds are epoch nanoseconds;
+    returns total (uptime, downtime) in seconds.
     """
-    if not observations:
-        return 0.0, 0.0
+    timestamps, active, cumulative_uptime = observations
     
-    total_seconds = (end_time - start_time).total_seconds()
-    uptime_seconds = 0.0
+    if len(timestamps) == 0:
+        return 0.0, 0.0
     
-    # Sort observations by timestamp
-    observations.sort(key=lambda x: x.timestamp_utc)
+    # Use the compiled sweep when numba is installed, NumPy otherwise
+    interval_totals = _interval_totals_jit or _interval_totals_numpy
+    uptime_ns, total_ns = interval_totals(
+        timestamps, active, cumulative_uptime, interval_starts, interval_ends
+    )
     
-    # Handle period before first observation
-    first_obs = observations[0]
-    if start_time < first_obs.timestamp_utc:
-        period_seconds = (first_obs.timestamp_utc - start_time).total_seconds()
-        if first_obs.status == 'active':
-            uptime_seconds += period_seconds
+    uptime_seconds = int(uptime_ns) / 1e9
+    downtime_seconds = int(total_ns - uptime_ns) / 1e9
     
-    # Handle periods between observations
-    for i in range(len(observations) - 1):
-        current_obs = observations[i]
-        next_obs = observations[i + 1]
-        
-        period_seconds = (next_obs.timestamp_utc - current_obs.timestamp_utc).total_seconds()
-        if current_obs.status == 'active':
-            uptime_seconds += period_seconds
+    return uptime_seconds, downtime_seconds
+
+def _interval_totals_numpy(
+    timestamps: np.ndarray,
+    active: np.ndarray,
+    cumulative_uptime: np.ndarray,
+    interval_starts: np.ndarray,
+    interval_ends: np.ndarray
+) -> Tuple[int, int]:
+    """
+    Total (uptime, observed) nanoseconds over all intervals, vectorized.
+    """
+    # Binary-search the first and last observation of every interval at once
+    first = np.searchsorted(timestamps, interval_starts, side='left')
+    last = np.searchsorted(timestamps, interval_ends, side='right') - 1
+    has_obs = last >= first
+    
+    # Clamp so empty intervals index safely; they are masked out below
+    first = np.minimum(first, len(timestamps) - 1)
+    last = np.maximum(last, 0)
+    
+    # Active gaps between the first and last observation in each interval,
+    # plus the edges before the first and after the last observation
+    uptime_ns = (
+        cumulative_uptime[last] - cumulative_uptime[first]
+        + np.where(active[first], timestamps[first] - interval_starts, 0)
+        + np.where(active[last], interval_ends - timestamps[last], 0)
+    )
     
-    # Handle period after last observation
-    last_obs = observations[-1]
-    if end_time > last_obs.timestamp_utc:
-        period_seconds = (end_time - last_obs.timestamp_utc).total_seconds()
-        if last_obs.status == 'active':
-            uptime_seconds += period_seconds
+    total_ns = int(np.where(has_obs, interval_ends - interval_starts, 0).sum())
+    uptime_ns = int(np.where(has_obs, uptime_ns, 0).sum())
     
-    downtime_seconds = total_seconds - uptime_seconds
+    return uptime_ns, total_ns
+
+def _interval_totals_loop(
+    timestamps: np.ndarray,
+    active: np.ndarray,
+    cumulative_uptime: np.ndarray,
+    interval_starts: np.ndarray,
+    interval_ends: np.ndarray
+) -> Tuple[int, int]:
+    """
+    Same totals as _interval_totals_numpy as a plain loop, for numba to
+    compile into a single native pass with no temporary arrays.
+    """
+    uptime_ns = 0
+    total_ns = 0
     
-    return uptime_seconds, downtime_seconds
+    for i in range(interval_starts.shape[0]):
+        start_ns = interval_starts[i]
+        end_ns = interval_ends[i]
+        
+        first = np.searchsorted(timestamps, start_ns, side='left')
+        last = np.searchsorted(timestamps, end_ns, side='right') - 1
+        if last < first:
+            continue
+        
+        total_ns += end_ns - start_ns
+        uptime_ns += cumulative_uptime[last] - cumulative_uptime[first]
+        if active[first]:
+            uptime_ns += timestamps[first] - start_ns
+        if active[last]:
+            uptime_ns += end_ns - timestamps[last]
+    
+    return uptime_ns, total_ns
+
+_interval_totals_jit = njit(cache=True)(_interval_totals_loop) if njit else None
 
 def get_business_intervals(
-    store_id: int, 
+    business_hours: BusinessHoursByDay, 
     start_time: datetime, 
     end_time: datetime,
-    local_tz: Any
+    local_tz: tzinfo,
+    utc_offset_s: Optional[int] = None
 ) -> List[Tuple[datetime, datetime]]:
     """
     Get all business hour intervals for a store within the given time period.
+    Intervals are returned as naive UTC datetimes, like the period bounds.
+    
+    utc_offset_s, when the offset is known to be constant over the period,
+    lets intervals be shifted arithmetically instead of localized one by one.
     """
     intervals = []
     
-    # Get business hours for the store
-    business_hours = db.session.query(BusinessHours).filter(
-        BusinessHours.store_id == store_id
-    ).all()
-    
     # If no business hours defined, assume 24/7 operation
     if not business_hours:
-        intervals.append((
-            start_time.replace(tzinfo=pytz.UTC).astimezone(local_tz),
-            end_time.replace(tzinfo=pytz.UTC).astimezone(local_tz)
-        ))
+        intervals.append((start_time, end_time))
         return intervals
     
+    if utc_offset_s is not None:
+        return _shift_business_intervals(business_hours, start_time, end_time, utc_offset_s)
+    
     # Convert times to local timezone
-    start_local = start_time.replace(tzinfo=pytz.UTC).astimezone(local_tz)
-    end_local = end_time.replace(tzinfo=pytz.UTC).astimezone(local_tz)
+    start_local = start_time.replace(tzinfo=UTC).astimezone(local_tz)
+    end_local = end_time.replace(tzinfo=UTC).astimezone(local_tz)
     
     # Iterate through each day in the period
     current_day = start_local.date()
@@ -344,48 +500,74 @@ def get_business_intervals(
         day_of_week = current_day.weekday()  # 0=Monday, 6=Sunday
         
         # Get business hours for this day
-        day_hours = [bh for bh in business_hours if bh.dayOfWeek == day_of_week]
+        for start_time_local, end_time_local in business_hours.get(day_of_week, []):
+            # Create datetime objects for business hours (PEP 495 tzinfo, no localize())
+            business_start = datetime.combine(current_day, start_time_local, tzinfo=local_tz)
+            business_end = datetime.combine(current_day, end_time_local, tzinfo=local_tz)
+            
+            # Handle overnight business hours
+            if end_time_local < start_time_local:
+                business_end += timedelta(days=1)
+            
+            # Clip to the requested period in UTC: aware datetimes sharing a
+            # tzinfo compare by wall clock, which misorders DST gap times
+            interval_start = max(business_start.astimezone(UTC).replace(tzinfo=None), start_time)
+            interval_end = min(business_end.astimezone(UTC).replace(tzinfo=None), end_time)
+            
+            if interval_start < interval_end:
+                intervals.append((interval_start, interval_end))
         
-        for hours in day_hours:
-            # Create datetime objects for business hours
-            business_start = local_tz.localize(
-                datetime.combine(current_day, hours.start_time_local)
-            )
-            business_end = local_tz.localize(
-                datetime.combine(current_day, hours.end_time_local)
-            )
+        current_day += timedelta(days=1)
+    
+    return intervals
+
+def _shift_business_intervals(
+    business_hours: BusinessHoursByDay,
+    start_time: datetime,
+    end_time: datetime,
+    utc_offset_s: int
+) -> List[Tuple[datetime, datetime]]:
+    """
+    get_business_intervals for a period with one UTC offset throughout:
+    naive local wall times are shifted by the offset, no tzinfo involved.
+    """
+    intervals = []
+    offset = timedelta(seconds=utc_offset_s)
+    start_local = start_time + offset
+    end_local = end_time + offset
+    
+    current_day = start_local.date()
+    end_day = end_local.date()
+    
+    while current_day <= end_day:
+        for start_time_local, end_time_local in business_hours.get(current_day.weekday(), []):
+            business_start = datetime.combine(current_day, start_time_local)
+            business_end = datetime.combine(current_day, end_time_local)
             
             # Handle overnight business hours
-            if hours.end_time_local < hours.start_time_local:
+            if end_time_local < start_time_local:
                 business_end += timedelta(days=1)
             
-            # Clip to the requested period
             interval_start = max(business_start, start_local)
             interval_end = min(business_end, end_local)
             
             if interval_start < interval_end:
-                intervals.append((interval_start, interval_end))
+                intervals.append((interval_start - offset, interval_end - offset))
         
         current_day += timedelta(days=1)
     
     return intervals
 
-def get_store_timezone(store_id: int) -> str:
+def get_store_timezone(store_id: int, timezone_map: Dict[str, str]) -> str:
     """
     Get timezone for a store, defaulting to America/Chicago if not found.
     """
-    timezone_record = db.session.query(Timezone).filter(
-        Timezone.store_id == store_id
-    ).first()
-    
-    if timezone_record:
-        return timezone_record.timezone_str
-    else:
-        return 'America/Chicago'
+    return timezone_map.get(store_id, 'America/Chicago')
 
 def save_report_to_csv(report_data: List[Dict], csv_path: str):
     """
     Save report data to CSV file with the required schema.
+    Paths ending in .gz are written gzip-compressed.
     """
     fieldnames = [
         'store_id',
@@ -397,11 +579,14 @@ def save_report_to_csv(report_data: List[Dict], csv_path: str):
         'downtime_last_week'
     ]
     
-    with open(csv_path, 'w', newline='', encoding='utf-8') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-        
-        for row in report_data:
-            writer.writerow(row)
+    # Pull each row's values out in schema order with a C-level itemgetter
+    # and hand them all to writerows, avoiding DictWriter's per-row lookups
+    row_values = map(itemgetter(*fieldnames), report_data)
+    
+    open_report = gzip.open if csv_path.endswith('.gz') else open
+    with open_report(csv_path, 'wt', newline='', encoding='utf-8') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(fieldnames)
+        writer.writerows(row_values)
     
     logging.info(f"Report saved to {csv_path} with {len(report_data)} stores")
@@ -1,34 +1,42 @@
 from app import db
-from datetime import datetime
-from typing import Optional
+
+# StoreStatus.status codes
+STATUS_INACTIVE = 0
+STATUS_ACTIVE = 1
+STATUS_CODES = {'inactive': STATUS_INACTIVE, 'active': STATUS_ACTIVE}
 
 class StoreStatus(db.Model):
     """
     Store status observations from CSV data.
     """
     __tablename__ = 'store_status'
+    # Per-store time range scans; the leading column also serves store_id lookups
+    __table_args__ = (db.Index('ix_ss_store_ts', 'store_id', 'timestamp_utc'),)
     
     id = db.Column(db.Integer, primary_key=True)
-    store_id = db.Column(db.String(50), nullable=False, index=True)  # Changed to String for UUID
+    store_id = db.Column(db.String(50), nullable=False)  # Changed to String for UUID
+    # Own index for MAX(timestamp_utc) and the report's all-store window scan
     timestamp_utc = db.Column(db.DateTime, nullable=False, index=True)
-    status = db.Column(db.String(10), nullable=False)  # 'active' or 'inactive'
+    status = db.Column(db.SmallInteger, nullable=False)  # 1=active, 0=inactive
     
     def __init__(self, store_id, timestamp_utc, status):
         self.store_id = store_id
         self.timestamp_utc = timestamp_utc
-        self.status = status
+        # Accept either the CSV's 'active'/'inactive' or a status code
+        self.status = STATUS_CODES[status] if isinstance(status, str) else int(status)
     
     def __repr__(self):
-        return f'<StoreStatus {self.store_id}: {self.status} at {self.timestamp_utc}>'
+        return f'<StoreStatus {self.id}>'
 
 class BusinessHours(db.Model):
     """
     Business hours for each store by day of week.
     """
     __tablename__ = 'business_hours'
+    __table_args__ = (db.Index('ix_bh_store_dow', 'store_id', 'dayOfWeek'),)
     
     id = db.Column(db.Integer, primary_key=True)
-    store_id = db.Column(db.String(50), nullable=False, index=True)  # Changed to String for UUID
+    store_id = db.Column(db.String(50), nullable=False)  # Changed to String for UUID
     dayOfWeek = db.Column(db.Integer, nullable=False)  # 0=Monday, 6=Sunday
     start_time_local = db.Column(db.Time, nullable=False)
     end_time_local = db.Column(db.Time, nullable=False)
@@ -40,7 +48,7 @@ class BusinessHours(db.Model):
         self.end_time_local = end_time_local
     
     def __repr__(self):
-        return f'<BusinessHours {self.store_id}: Day {self.dayOfWeek} {self.start_time_local}-{self.end_time_local}>'
+        return f'<BusinessHours {self.id}>'
 
 class Timezone(db.Model):
     """
@@ -57,7 +65,7 @@ class Timezone(db.Model):
         self.timezone_str = timezone_str
     
     def __repr__(self):
-        return f'<Timezone {self.store_id}: {self.timezone_str}>'
+        return f'<Timezone {self.store_id}>'
 
 class Report(db.Model):
     """
@@ -69,7 +77,7 @@ class Report(db.Model):
     report_id = db.Column(db.String(36), nullable=False, unique=True, index=True)
     status = db.Column(db.String(20), nullable=False)  # 'Running', 'Complete', 'Failed'
     report_path = db.Column(db.String(255), nullable=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, default=db.func.now(), server_default=db.func.now())
     
     def __init__(self, report_id, status, report_path=None):
         self.report_id = report_id
@@ -77,4 +85,4 @@ class Report(db.Model):
         self.report_path = report_path
     
     def __repr__(self):
-        return f'<Report {self.report_id}: {self.status}>'
+        return f'<Report {self.report_id}>'
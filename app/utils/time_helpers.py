@@ -1,6 +1,63 @@
-import pytz
-from datetime import datetime, time
+from datetime import datetime, time, timedelta, timezone
+from functools import lru_cache
 from typing import Optional, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+UTC = timezone.utc
+
+# Years over which a timezone must keep one UTC offset to use the fast path
+FIXED_OFFSET_YEARS = (1970, 2038)
+
+SECONDS_PER_DAY = 86400
+MICROSECONDS_PER_DAY = SECONDS_PER_DAY * 1_000_000
+
+# Zones known to have a single UTC offset, skipping the sampling below
+FIXED_OFFSET_ZONES = frozenset({'UTC', 'GMT', 'Zulu', 'UCT', 'Universal'})
+
+# Any DST period or offset change lasts weeks, so sampling every two weeks
+# cannot step over one
+_FIXED_OFFSET_SAMPLE_STEP = timedelta(days=14)
+
+_ONE_DAY = timedelta(days=1)
+_ONE_HOUR = timedelta(hours=1)
+
+@lru_cache(maxsize=512)
+def get_tz(timezone_str: str) -> ZoneInfo:
+    """
+    Cached ZoneInfo lookup so repeated store timezones share one tzinfo.
+    """
+    return ZoneInfo(timezone_str)
+
+@lru_cache(maxsize=512)
+def _get_fixed_offset(timezone_str: str) -> Optional[timedelta]:
+    """
+    UTC offset of a timezone that never changes it (no DST or rule changes)
+    between 1970 and 2037, or None. Computed once per timezone.
+    """
+    tz = get_tz(timezone_str)
+    
+    current = datetime(FIXED_OFFSET_YEARS[0], 1, 1, tzinfo=UTC)
+    end = datetime(FIXED_OFFSET_YEARS[1], 1, 1, tzinfo=UTC)
+    offset = current.astimezone(tz).utcoffset()
+    
+    # UTC and the Etc/ zones are fixed offsets by definition
+    if timezone_str in FIXED_OFFSET_ZONES or timezone_str.startswith('Etc/'):
+        return offset
+    
+    while current < end:
+        if current.astimezone(tz).utcoffset() != offset:
+            return None
+        current += _FIXED_OFFSET_SAMPLE_STEP
+    
+    return offset
+
+def _fixed_offset_for(timezone_str: str, dt: datetime) -> Optional[timedelta]:
+    """
+    Fixed UTC offset usable for dt, or None if the slow path is required.
+    """
+    if not FIXED_OFFSET_YEARS[0] <= dt.year < FIXED_OFFSET_YEARS[1]:
+        return None
+    return _get_fixed_offset(timezone_str)
 
 def convert_utc_to_local(utc_dt: datetime, timezone_str: str) -> datetime:
     """
@@ -13,12 +70,17 @@ def convert_utc_to_local(utc_dt: datetime, timezone_str: str) -> datetime:
     Returns:
         Local datetime object with timezone info
     """
-    utc_tz = pytz.UTC
-    local_tz = pytz.timezone(timezone_str)
+    local_tz = get_tz(timezone_str)
+    
+    # Fast path for UTC and fixed-offset timezones: no transition lookup
+    if utc_dt.tzinfo is None or utc_dt.tzinfo is UTC:
+        fixed_offset = _fixed_offset_for(timezone_str, utc_dt)
+        if fixed_offset is not None:
+            return (utc_dt + fixed_offset).replace(tzinfo=local_tz)
     
     # Ensure UTC datetime has timezone info
     if utc_dt.tzinfo is None:
-        utc_dt = utc_tz.localize(utc_dt)
+        utc_dt = utc_dt.replace(tzinfo=UTC)
     
     # Convert to local timezone
     local_dt = utc_dt.astimezone(local_tz)
@@ -36,14 +98,20 @@ def convert_local_to_utc(local_dt: datetime, timezone_str: str) -> datetime:
     Returns:
         UTC datetime object (timezone naive)
     """
-    local_tz = pytz.timezone(timezone_str)
+    local_tz = get_tz(timezone_str)
+    
+    # Fast path for UTC and fixed-offset timezones: no transition lookup
+    if local_dt.tzinfo is None:
+        fixed_offset = _fixed_offset_for(timezone_str, local_dt)
+        if fixed_offset is not None:
+            return local_dt - fixed_offset
     
-    # Localize the datetime if it's naive
+    # Attach the timezone if it's naive (PEP 495 tzinfo, no localize() needed)
     if local_dt.tzinfo is None:
-        local_dt = local_tz.localize(local_dt)
+        local_dt = local_dt.replace(tzinfo=local_tz)
     
     # Convert to UTC and remove timezone info
-    utc_dt = local_dt.astimezone(pytz.UTC)
+    utc_dt = local_dt.astimezone(UTC)
     return utc_dt.replace(tzinfo=None)
 
 def get_business_hours_for_day(day_of_week: int, business_hours: list) -> list:
@@ -65,6 +133,21 @@ def get_business_hours_for_day(day_of_week: int, business_hours: list) -> list:
     
     return day_hours
 
+def _in_daily_window(t: int, start: int, end: int, period: int) -> bool:
+    """
+    Branchless check that time-of-day t lies in [start, end] on a circular
+    day of `period` units. Measuring both t and end as offsets from start
+    modulo the day makes overnight hours (e.g., 22:00 to 06:00) wrap
+    naturally, with no separate case for crossing midnight.
+    """
+    return (end - start) % period >= (t - start) % period
+
+def _time_to_microseconds(t: time) -> int:
+    """
+    Convert a time of day to microseconds since midnight.
+    """
+    return (t.hour * 3600 + t.minute * 60 + t.second) * 1_000_000 + t.microsecond
+
 def is_within_business_hours(
     local_dt: datetime, 
     start_time: time, 
@@ -83,13 +166,12 @@ def is_within_business_hours(
     """
     current_time = local_dt.time()
     
-    # Handle overnight business hours (e.g., 22:00 to 06:00)
-    if end_time < start_time:
-        # Business hours cross midnight
-        return current_time >= start_time or current_time <= end_time
-    else:
-        # Normal business hours within same day
-        return start_time <= current_time <= end_time
+    return _in_daily_window(
+        _time_to_microseconds(current_time),
+        _time_to_microseconds(start_time),
+        _time_to_microseconds(end_time),
+        MICROSECONDS_PER_DAY
+    )
 
 def get_timezone_offset_hours(timezone_str: str, dt: datetime) -> float:
     """
@@ -102,11 +184,16 @@ def get_timezone_offset_hours(timezone_str: str, dt: datetime) -> float:
     Returns:
         Offset in hours (can be negative)
     """
-    tz = pytz.timezone(timezone_str)
+    # Fast path for UTC and fixed-offset timezones: no transition lookup
+    fixed_offset = _fixed_offset_for(timezone_str, dt)
+    if fixed_offset is not None:
+        return fixed_offset.total_seconds() / 3600.0
+    
+    tz = get_tz(timezone_str)
     
     if dt.tzinfo is None:
         # Assume UTC if no timezone info
-        dt = pytz.UTC.localize(dt)
+        dt = dt.replace(tzinfo=UTC)
     
     local_dt = dt.astimezone(tz)
     offset = local_dt.utcoffset()
@@ -116,6 +203,48 @@ def get_timezone_offset_hours(timezone_str: str, dt: datetime) -> float:
     
     return offset_seconds / 3600.0
 
+@lru_cache(maxsize=4096)
+def get_timezone_offset_seconds_for_window(
+    timezone_str: str,
+    start_utc: datetime,
+    end_utc: datetime
+) -> Optional[int]:
+    """
+    Get the UTC offset in seconds if it is constant over a UTC window.
+    
+    Stores sharing a timezone and report window share one cached result.
+    
+    Args:
+        timezone_str: Timezone string (e.g., 'America/Chicago')
+        start_utc: Window start (naive UTC or aware)
+        end_utc: Window end, inclusive (naive UTC or aware)
+    
+    Returns:
+        Offset in seconds, or None if a DST transition falls in the window
+    """
+    if start_utc.tzinfo is None:
+        start_utc = start_utc.replace(tzinfo=UTC)
+    if end_utc.tzinfo is None:
+        end_utc = end_utc.replace(tzinfo=UTC)
+    
+    fixed_offset = _fixed_offset_for(timezone_str, start_utc)
+    if fixed_offset is not None and _fixed_offset_for(timezone_str, end_utc) is not None:
+        return int(fixed_offset.total_seconds())
+    
+    # zoneinfo does not expose its transition table; transitions are at least
+    # days apart, so sampling the window daily plus its end finds any of them
+    tz = get_tz(timezone_str)
+    offset = start_utc.astimezone(tz).utcoffset()
+    current = start_utc + _ONE_DAY
+    while current < end_utc:
+        if current.astimezone(tz).utcoffset() != offset:
+            return None
+        current += _ONE_DAY
+    if end_utc.astimezone(tz).utcoffset() != offset:
+        return None
+    
+    return int(offset.total_seconds())
+
 def datetime_range(start: datetime, end: datetime, step_hours: int = 1):
     """
     Generate datetime range with specified step.
@@ -128,10 +257,8 @@ def datetime_range(start: datetime, end: datetime, step_hours: int = 1):
     Yields:
         Datetime objects in the range
     """
-    from datetime import timedelta
-    
     current = start
-    step = timedelta(hours=step_hours)
+    step = _ONE_HOUR if step_hours == 1 else timedelta(hours=step_hours)
     
     while current <= end:
         yield current
@@ -148,11 +275,22 @@ def validate_timezone(timezone_str: str) -> bool:
         True if valid, False otherwise
     """
     try:
-        pytz.timezone(timezone_str)
+        get_tz(timezone_str)
         return True
-    except pytz.exceptions.UnknownTimeZoneError:
+    except (ZoneInfoNotFoundError, ValueError):
         return False
 
+@lru_cache(maxsize=4096)
+def _day_bounds_cached(timezone_str: str, year: int, month: int, day: int) -> Tuple[datetime, datetime]:
+    """
+    Start and end of one local calendar day, shared by every store in the
+    same timezone.
+    """
+    local_tz = get_tz(timezone_str)
+    day_start = datetime(year, month, day, tzinfo=local_tz)
+    day_end = datetime(year, month, day, 23, 59, 59, 999999, tzinfo=local_tz)
+    return day_start, day_end
+
 def get_day_boundaries_local(dt: datetime, timezone_str: str) -> Tuple[datetime, datetime]:
     """
     Get start and end of day boundaries in local timezone.
@@ -164,18 +302,11 @@ def get_day_boundaries_local(dt: datetime, timezone_str: str) -> Tuple[datetime,
     Returns:
         Tuple of (day_start, day_end) in local timezone
     """
-    local_tz = pytz.timezone(timezone_str)
-    
     # Convert to local timezone
     if dt.tzinfo is None:
-        dt = pytz.UTC.localize(dt)
-    
-    local_dt = dt.astimezone(local_tz)
+        dt = dt.replace(tzinfo=UTC)
     
-    # Get start of day (midnight)
-    day_start = local_dt.replace(hour=0, minute=0, second=0, microsecond=0)
+    local_dt = dt.astimezone(get_tz(timezone_str))
     
-    # Get end of day (23:59:59.999999)
-    day_end = local_dt.replace(hour=23, minute=59, second=59, microsecond=999999)
-    
-    return day_start, day_end
+    # Cached on the local date, which is what the boundaries depend on
+    return _day_bounds_cached(timezone_str, local_dt.year, local_dt.month, local_dt.day)
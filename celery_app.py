@@ -4,10 +4,14 @@ Celery worker startup script.
 Run this script to start the Celery worker process.
 
 Usage:
-    python celery_app.py worker --loglevel=info
+    python celery_app.py [worker [options]]
+
+With no arguments a worker is started. Worker runs get WORKER_DEFAULT_ARGS
+ahead of any options given, so those options take precedence.
 """
 
 import os
+import sys
 import logging
 from dotenv import load_dotenv
 
@@ -15,11 +19,26 @@ from dotenv import load_dotenv
 load_dotenv()
 
 # Set up logging
-logging.basicConfig(level=logging.DEBUG)
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()
+logging.basicConfig(level=LOG_LEVEL)
 
 # Import the Celery instance
 from app import celery
 
+# Prefork processes for CPU-bound reports, fair scheduling so long tasks
+# don't block prefetched ones, and no worker-to-worker chatter
+WORKER_DEFAULT_ARGS = [
+    '--pool=prefork',
+    '-O', 'fair',
+    '--without-gossip',
+    '--without-mingle',
+    '--without-heartbeat',
+    f'--loglevel={LOG_LEVEL}',
+]
+
 if __name__ == '__main__':
-    # Start Celery worker
-    celery.start()
+    # Start Celery worker (sys.argv[0] is this script, not a celery command)
+    argv = sys.argv[1:] or ['worker']
+    if argv[0] == 'worker':
+        argv = ['worker', *WORKER_DEFAULT_ARGS, *argv[1:]]
+    sys.exit(celery.start(argv=argv))
@@ -3,9 +3,8 @@
 Generate store status data for the new UUID-based store system
 """
 
-import csv
-import random
 from datetime import datetime, timedelta
+import numpy as np
 import pandas as pd
 
 def generate_store_status_data():
@@ -14,7 +13,7 @@ def generate_store_status_data():
     # Get store IDs from both files to ensure consistency
     print("Reading store IDs from menu_hours.csv...")
     menu_df = pd.read_csv('data/menu_hours.csv')
-    store_ids = menu_df['store_id'].unique().tolist()
+    store_ids = menu_df['store_id'].unique()
     
     print(f"Found {len(store_ids)} unique stores")
     
@@ -22,61 +21,64 @@ def generate_store_status_data():
     end_time = datetime(2023, 1, 26, 17, 0, 0)  # Match the original timestamp
     start_time = end_time - timedelta(days=7)
     
-    status_records = []
-    
     print("Generating store status data...")
     
-    for store_id in store_ids:
-        # Generate random status changes for each store
-        current_time = start_time
-        current_status = random.choice(['active', 'inactive'])
-        
-        # Generate 20-50 status changes per store over the week
-        num_changes = random.randint(20, 50)
-        
-        for i in range(num_changes):
-            # Add timestamp
-            status_records.append({
-                'store_id': store_id,
-                'status': current_status,
-                'timestamp_utc': current_time.strftime('%Y-%m-%d %H:%M:%S.%f UTC')
-            })
-            
-            # Move to next timestamp (random interval between 1-8 hours)
-            hours_forward = random.uniform(1, 8)
-            current_time += timedelta(hours=hours_forward)
-            
-            # Stop if we exceed end time
-            if current_time > end_time:
-                break
-            
-            # Randomly flip status (80% chance to stay same, 20% chance to flip)
-            if random.random() < 0.2:
-                current_status = 'inactive' if current_status == 'active' else 'active'
+    # Draw all random values for every store at once instead of per record
+    rng = np.random.default_rng()
+    
+    # Generate 20-50 status changes per store over the week
+    num_changes = rng.integers(20, 51, size=len(store_ids))
+    total = int(num_changes.sum())
+    store_index = np.repeat(np.arange(len(store_ids)), num_changes)
+    store_starts = np.repeat(np.cumsum(num_changes) - num_changes, num_changes)
+    
+    # Each record is a random 1-8 hours after the previous one of its store;
+    # offsets are exclusive cumulative sums restarted at each store
+    hours_forward = rng.uniform(1, 8, total)
+    elapsed = np.cumsum(hours_forward) - hours_forward
+    offset_hours = elapsed - elapsed[store_starts]
+    
+    # Each store starts active or inactive at random, then after every record
+    # flips status with 20% probability (80% chance to stay the same)
+    flips = (rng.random(total) < 0.2).astype(np.int64)
+    flip_counts = np.cumsum(flips) - flips
+    flip_counts -= flip_counts[store_starts]
+    initially_active = rng.random(len(store_ids)) < 0.5
+    active = initially_active[store_index] ^ (flip_counts % 2 == 1)
+    
+    timestamps = np.datetime64(start_time, 'us') + (offset_hours * 3600e6).astype('timedelta64[us]')
+    
+    status_df = pd.DataFrame({
+        'store_id': store_ids[store_index],
+        'status': np.where(active, 'active', 'inactive'),
+        'timestamp_utc': timestamps
+    })
+    
+    # Stop each store's records once they pass the end time
+    status_df = status_df[status_df['timestamp_utc'] <= end_time]
     
     # Sort by timestamp
-    status_records.sort(key=lambda x: x['timestamp_utc'])
+    status_df = status_df.sort_values('timestamp_utc', kind='stable')
+    
+    # Format as '%Y-%m-%d %H:%M:%S.%f UTC' with NumPy's C ISO formatter,
+    # far cheaper than strftime on every timestamp
+    iso = np.datetime_as_string(status_df['timestamp_utc'].to_numpy(dtype='datetime64[us]'), unit='us')
+    status_df['timestamp_utc'] = np.char.add(np.char.replace(iso, 'T', ' '), ' UTC')
     
-    print(f"Generated {len(status_records)} status records")
+    print(f"Generated {len(status_df)} status records")
     
     # Write to CSV
-    with open('data/store_status.csv', 'w', newline='') as csvfile:
-        fieldnames = ['store_id', 'status', 'timestamp_utc']
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        
-        writer.writeheader()
-        for record in status_records:
-            writer.writerow(record)
+    status_df.to_csv('data/store_status.csv', index=False)
     
     print("Store status data written to data/store_status.csv")
     
     # Show sample data
     print("\nSample records:")
-    for i, record in enumerate(status_records[:10]):
-        print(f"  {record['store_id'][:8]}... | {record['status']} | {record['timestamp_utc']}")
+    for record in status_df.head(10).itertuples(index=False):
+        print(f"  {record.store_id[:8]}... | {record.status} | {record.timestamp_utc}")
     
-    return len(status_records), len(store_ids)
+    return len(status_df), len(store_ids)
 
 if __name__ == "__main__":
     num_records, num_stores = generate_store_status_data()
-    print(f"\n✅ Successfully generated {num_records} status records for {num_stores} stores")
\ No newline at end of file
+    print(f"\n✅ Successfully generated {num_records} status records for {num_stores} stores")
@@ -1,6 +1,8 @@
 from app import create_app, db
+from app.core.data_loader import migrate_store_status_codes
 
 app = create_app()
 with app.app_context():
     db.create_all()
+    migrate_store_status_codes()
     print('Database tables created successfully!')
\ No newline at end of file
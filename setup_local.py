@@ -41,6 +41,10 @@ def main():
             db.create_all()
             print("✅ Database tables created successfully!")
             
+            # Rebuild store_status if it predates integer status codes
+            from app.core.data_loader import migrate_store_status_codes
+            migrate_store_status_codes()
+            
             # Test database connection
             result = db.session.execute(db.text('SELECT 1')).scalar()
             if result == 1:
@@ -48,8 +52,8 @@ def main():
             
             # Load CSV data
             print("📊 Loading CSV data...")
-            from app.core.data_loader import load_all_data
-            load_all_data()
+            from app.core.data_loader import load_data
+            load_data()
             print("✅ CSV data loaded successfully!")
             
             # Test report generation
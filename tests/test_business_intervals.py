@@ -0,0 +1,66 @@
+"""
+get_business_intervals across DST transitions, and the fixed-offset shortcut.
+"""
+
+from datetime import datetime, time, timedelta
+
+import pytest
+
+from app.core.reporter import _shift_business_intervals, get_business_intervals
+from app.utils.time_helpers import get_tz, get_timezone_offset_seconds_for_window
+
+NEW_YORK = 'America/New_York'
+
+def business_intervals(business_hours, start_time, end_time, timezone_str=NEW_YORK):
+    return get_business_intervals(business_hours, start_time, end_time, get_tz(timezone_str))
+
+def test_overnight_interval_across_spring_forward():
+    # Saturday 22:00 to Sunday 06:00 local on 2023-03-12, when New York
+    # skips 02:00-03:00: 03:00 UTC (EST) to 10:00 UTC (EDT)
+    intervals = business_intervals(
+        {5: [(time(22, 0), time(6, 0))]},
+        datetime(2023, 3, 11, 12, 0), datetime(2023, 3, 12, 12, 0)
+    )
+
+    assert intervals == [(datetime(2023, 3, 12, 3, 0), datetime(2023, 3, 12, 10, 0))]
+    assert intervals[0][1] - intervals[0][0] == timedelta(hours=7)
+
+@pytest.mark.parametrize('start_time_local', [time(2, 0), time(2, 30)])
+def test_business_hours_starting_in_spring_forward_gap(start_time_local):
+    # 02:xx does not exist on 2023-03-12; read with fold=0 it falls at or
+    # after 03:00 EDT, so the interval is empty
+    intervals = business_intervals(
+        {6: [(start_time_local, time(3, 0))]},
+        datetime(2023, 3, 12, 0, 0), datetime(2023, 3, 13, 0, 0)
+    )
+
+    assert intervals == []
+
+def test_ambiguous_fall_back_time_uses_first_occurrence():
+    # 01:30 happens twice on 2023-11-05; fold=0 picks the EDT one, 05:30 UTC
+    intervals = business_intervals(
+        {6: [(time(1, 30), time(5, 0))]},
+        datetime(2023, 11, 5, 0, 0), datetime(2023, 11, 6, 0, 0)
+    )
+
+    assert intervals == [(datetime(2023, 11, 5, 5, 30), datetime(2023, 11, 5, 10, 0))]
+
+@pytest.mark.parametrize('timezone_str', [NEW_YORK, 'Asia/Kolkata', 'Australia/Sydney', 'UTC'])
+@pytest.mark.parametrize('start_time', [datetime(2023, 1, 20, 9, 17), datetime(2023, 6, 20, 23, 45)])
+def test_shift_matches_zoneinfo_without_transitions(timezone_str, start_time):
+    business_hours = {
+        0: [(time(9, 0), time(17, 0))],
+        2: [(time(0, 0), time(23, 59, 59))],
+        4: [(time(8, 0), time(12, 0)), (time(13, 0), time(20, 30))],
+        5: [(time(22, 0), time(3, 0))],
+        6: [(time(23, 0), time(1, 0))],
+    }
+    end_time = start_time + timedelta(weeks=1)
+    utc_offset_s = get_timezone_offset_seconds_for_window(timezone_str, start_time, end_time)
+    assert utc_offset_s is not None
+
+    expected = business_intervals(business_hours, start_time, end_time, timezone_str)
+    shifted = _shift_business_intervals(business_hours, start_time, end_time, utc_offset_s)
+
+    assert shifted == expected
+    assert len(expected) > 0
@@ -0,0 +1,68 @@
+"""
+The NumPy interval sweep and the plain loop numba compiles must agree.
+"""
+
+import numpy as np
+import pytest
+
+from app.core.reporter import _interval_totals_loop, _interval_totals_numpy
+
+def make_observations(timestamps, active):
+    """
+    Observation arrays as generate_store_metrics builds them: each gap
+    counts as uptime when the observation that opens it is active.
+    """
+    timestamps = np.asarray(timestamps, dtype='int64')
+    active = np.asarray(active, dtype=bool)
+    gaps = np.diff(timestamps, prepend=timestamps[:1]) * np.concatenate(([False], active[:-1]))
+    return timestamps, active, np.cumsum(gaps)
+
+def assert_kernels_agree(observations, interval_starts, interval_ends):
+    interval_starts = np.asarray(interval_starts, dtype='int64')
+    interval_ends = np.asarray(interval_ends, dtype='int64')
+
+    expected = _interval_totals_loop(*observations, interval_starts, interval_ends)
+    actual = _interval_totals_numpy(*observations, interval_starts, interval_ends)
+
+    assert tuple(int(total) for total in actual) == tuple(int(total) for total in expected)
+    return expected
+
+@pytest.mark.parametrize('seed', range(20))
+def test_random_inputs(seed):
+    rng = np.random.default_rng(seed)
+    count = int(rng.integers(1, 200))
+    timestamps = np.sort(rng.choice(1_000_000, size=count, replace=False))
+    observations = make_observations(timestamps, rng.random(count) < 0.7)
+
+    interval_starts = np.sort(rng.integers(-1000, 1_000_000, size=int(rng.integers(1, 30))))
+    interval_ends = interval_starts + rng.integers(1, 100_000, size=len(interval_starts))
+
+    assert_kernels_agree(observations, interval_starts, interval_ends)
+
+def test_interval_without_observations():
+    observations = make_observations([100, 200], [True, False])
+
+    # Before, between and after the observations: nothing is counted
+    uptime_ns, total_ns = assert_kernels_agree(observations, [0, 120, 300], [50, 180, 400])
+    assert (uptime_ns, total_ns) == (0, 0)
+
+def test_observations_on_interval_bounds():
+    observations = make_observations([100, 150, 200], [True, False, True])
+
+    # Observations exactly at the start and end both fall inside the interval
+    uptime_ns, total_ns = assert_kernels_agree(observations, [100], [200])
+    assert (uptime_ns, total_ns) == (50, 100)
+
+    # An interval starting on the last observation sees only that one
+    uptime_ns, total_ns = assert_kernels_agree(observations, [200], [260])
+    assert (uptime_ns, total_ns) == (60, 60)
+
+    # An interval ending on the first observation sees only that one
+    uptime_ns, total_ns = assert_kernels_agree(observations, [40], [100])
+    assert (uptime_ns, total_ns) == (60, 60)
+
+def test_single_observation_and_zero_length_interval():
+    observations = make_observations([100], [False])
+
+    uptime_ns, total_ns = assert_kernels_agree(observations, [100, 50], [100, 150])
+    assert (uptime_ns, total_ns) == (0, 100)